@@ -12,4 +12,33 @@ CREATE TABLE `test` (
     `col7` INTEGER(1)
 );
 
+DROP TABLE IF EXISTS `upsert`;
+
+CREATE TABLE `upsert` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `name` VARCHAR(255),
+    `value` INTEGER,
+    UNIQUE (`name`)
+);
+
+DROP TABLE IF EXISTS `notnull`;
+
+CREATE TABLE `notnull` (
+    `id` INTEGER PRIMARY KEY,
+    `name` VARCHAR(255) NOT NULL,
+    `value` INTEGER
+);
+
+INSERT INTO `notnull` VALUES (1, 'first', 1);
+
+DROP TABLE IF EXISTS `partial`;
+
+CREATE TABLE `partial` (
+    `id` INTEGER PRIMARY KEY AUTOINCREMENT,
+    `name` VARCHAR(255),
+    `active` INTEGER
+);
+
+CREATE UNIQUE INDEX `partial_name` ON `partial` (`name`) WHERE `active` = 1;
+
 COMMIT;
\ No newline at end of file